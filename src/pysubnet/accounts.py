@@ -12,12 +12,12 @@ class AccountKeyType(Enum):
     # Make the enum case-insensitive for command line input
     @classmethod
     def from_string(cls, s):
-        try:
-            return cls(s.lower())
-        except ValueError:
+        account_key_type = _ACCT_BY_STR.get(s.lower())
+        if account_key_type is None:
             raise argparse.ArgumentTypeError(
-                f"Invalid account type. Choose from: {', '.join([e.value for e in cls])}"
+                f"Invalid account type. Choose from: {', '.join(_ACCT_BY_STR)}"
             )
+        return account_key_type
 
     def get_vkey(self) -> str:
         """
@@ -25,10 +25,14 @@ class AccountKeyType(Enum):
         The vkey is a string key used to identify ValidatorId which here is either
         the ecdsa pub key or ss58 address
         """
-        match self:
-            case AccountKeyType.AccountId20:
-                return "validator-accountid20-public-key"
-            case AccountKeyType.AccountId32:
-                return "validator-accountid32-ss58"
-            case _:
-                raise ValueError(f"Unsupported AccountKeyType: {self}")
+        return _VKEY[self]
+
+
+# Lookup table for `AccountKeyType.from_string`
+_ACCT_BY_STR = {e.value: e for e in AccountKeyType}
+
+# ValidatorId node key for each `AccountKeyType`, see `AccountKeyType.get_vkey`
+_VKEY = {
+    AccountKeyType.AccountId20: "validator-accountid20-public-key",
+    AccountKeyType.AccountId32: "validator-accountid32-ss58",
+}
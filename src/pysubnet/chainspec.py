@@ -1,10 +1,145 @@
+import copy
 import json
 import os
+import re
 from pathlib import Path
 from enum import Enum
-from typing import Union, Optional
+from typing import Union, Optional, TYPE_CHECKING
 from pydantic import BaseModel, field_validator
-from pysubnet.helpers.substrate import Substrate
+
+from pysubnet.helpers import serialization
+
+if TYPE_CHECKING:
+    from pysubnet.helpers.substrate import Substrate
+
+
+# Bytes read from the head of a chainspec file to look for its chain id
+CHAIN_ID_SCAN_SIZE = 64 * 1024
+# JSON strings and brackets, enough to track the nesting depth of a document
+_JSON_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+# The `: "<value>"` following an `"id"` key
+_CHAIN_ID_VALUE_RE = re.compile(rb'\s*:\s*"([^"\\]*)"')
+
+
+def _scan_chain_id(path) -> Optional[str]:
+    """
+    Top level chain id read off the head of the chainspec file at `path` without parsing
+    the file, or None if it isn't found before the `genesis` entry.
+    """
+    with open(path, "rb") as f:
+        head = f.read(CHAIN_ID_SCAN_SIZE)
+    depth = 0
+    for token in _JSON_TOKEN_RE.finditer(head):
+        value = token.group()
+        if value in (b"{", b"["):
+            depth += 1
+        elif value in (b"}", b"]"):
+            depth -= 1
+        elif depth == 1:
+            if value == b'"id"':
+                # Only a key is followed by a colon, a string value "id" is skipped
+                match = _CHAIN_ID_VALUE_RE.match(head, token.end())
+                if match is not None:
+                    return match.group(1).decode("utf-8")
+            elif value == b'"genesis"':
+                return None
+    return None
+
+
+def _spec_cache_path(chain: str) -> Optional[Path]:
+    """
+    On disk cache location for the `build-spec` output of a builtin `chain`, or None if
+    caching is disabled with PYSUBNET_NO_CACHE=1 or no home directory can be resolved.
+    There is one entry per chain, overwritten whenever the substrate build changes.
+    """
+    if os.environ.get("PYSUBNET_NO_CACHE") == "1":
+        return None
+    try:
+        cache_dir = Path(
+            os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache", "pysubnet"
+        )
+    except RuntimeError:
+        return None
+    return cache_dir / f"build-spec-{chain}.json"
+
+
+def _load_cached_spec(cache_path: Path, fingerprint: str) -> Optional[dict]:
+    """The cached spec at `cache_path` if it was built by the substrate `fingerprint`"""
+    try:
+        entry = serialization.load_file(cache_path)
+    except (ValueError, OSError):
+        return None  # Missing or unreadable entry, rebuild it
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    return entry.get("spec")
+
+
+# (substrate, chain, `stat_key` of a chainspec file or None) -> `build-spec` output
+_built_specs = {}
+
+
+def _build_spec(
+    substrate: "Substrate", chain: str, persist: bool = False, cwd=None
+) -> dict:
+    """
+    `build-spec` output for `chain`, memoized per substrate instance so the genesis
+    is only built once per run. A chainspec file is also keyed on its (mtime_ns, size),
+    so edits to it are picked up. Callers must not modify the returned dict.
+    `cwd` is where the command runs (for docker, the directory mounted for its output),
+    it doesn't change the output so it isn't part of the key.
+    With `persist` the output is also cached on disk across runs, keyed by the exact
+    substrate build, which is only valid for chains builtin to the node.
+    """
+    key = (substrate, chain, None if persist else serialization.stat_key(chain))
+    spec = _built_specs.get(key)
+    if spec is not None:
+        return spec
+
+    cache_path = _spec_cache_path(chain) if persist else None
+    fingerprint = None
+    if cache_path is not None:
+        try:
+            fingerprint = substrate.fingerprint
+        except Exception:
+            cache_path = None  # The substrate build can't be identified, don't cache
+    if cache_path is not None:
+        spec = _load_cached_spec(cache_path, fingerprint)
+        if spec is not None:
+            _built_specs[key] = spec
+            return spec
+
+    spec = substrate.run_command(
+        [
+            "build-spec",
+            "--chain",
+            chain,
+            "--disable-default-bootnode",
+        ],
+        cwd=cwd,
+        json=True,
+    )
+    _built_specs[key] = spec
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic, concurrent runs never see a partially written entry. Replaces the
+            # entry of a previous substrate build so the cache doesn't grow with rebuilds
+            serialization.dump_file(
+                cache_path, {"fingerprint": fingerprint, "spec": spec}, pretty=False
+            )
+        except OSError:
+            pass  # Caching is best effort
+    return spec
+
+
+def release_cached_chainspecs():
+    """
+    Drop the chainspecs kept in memory for reuse, i.e. parsed chainspec files and
+    `build-spec` output. Call once they are no longer needed, they can be large.
+    """
+    _built_specs.clear()
+    serialization.forget_files()
 
 
 class ChainspecType(str, Enum):
@@ -12,6 +147,10 @@ class ChainspecType(str, Enum):
     DEV = "dev"
 
 
+# Lookup table for builtin chain names in `Chainspec.parse_value`
+_CHAINSPEC_TYPES = {e.value: e for e in ChainspecType}
+
+
 class Chainspec(BaseModel):
     value: Union[Path, ChainspecType] = ChainspecType.LOCAL
 
@@ -26,31 +165,33 @@ class Chainspec(BaseModel):
         if isinstance(v, Path):
             return cls._validate_path(v)
         if isinstance(v, str):
-            if v.lower() in ("local", "dev"):
-                return ChainspecType(v.lower())
+            # Exact names skip the lower() copy, other casings are still accepted
+            chainspec_type = _CHAINSPEC_TYPES.get(v) or _CHAINSPEC_TYPES.get(v.lower())
+            if chainspec_type is not None:
+                return chainspec_type
             return cls._validate_path(Path(v))
         raise ValueError(f"Invalid chainspec value: {v}")
 
     @classmethod
     def _validate_path(cls, path: Path) -> Path:
         """Validate the path points to a valid chainspec file."""
-        if not path.is_file():
-            raise ValueError(f"'{path}' is not a valid file path")
-
         try:
-            with path.open("r") as f:
-                data = json.load(f)
+            # Cached, so get_chainid and load_json don't parse the file a second time
+            data = serialization.load_file_cached(path)
+        except (FileNotFoundError, IsADirectoryError):
+            # Let the read itself tell us, rather than an extra is_file() stat up front
+            raise ValueError(f"'{path}' is not a valid file path")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in chainspec file '{path}': {e}")
         except OSError as e:
             raise ValueError(f"Error reading chainspec file '{path}': {e}")
 
-        # Validate chainspec structure
-        missing = [key for key in ["name", "id"] if key not in data]
-        if missing:
+        # Validate chainspec structure, the happy path is a few dict lookups
+        if not ("name" in data and "id" in data):
+            missing = [key for key in ("name", "id") if key not in data]
             raise ValueError(f"Chainspec missing required fields: {missing}")
 
-        if "genesis" not in data or "runtimeGenesis" not in data["genesis"]:
+        if "runtimeGenesis" not in data.get("genesis", ()):
             raise ValueError("Chainspec missing genesis.runtimeGenesis configuration")
 
         return os.path.abspath(path)
@@ -60,17 +201,26 @@ class Chainspec(BaseModel):
             return str(self.value)
         return self.value.value
 
+    # Builtin values need no validation, local() and dev() skip the validator pipeline
     @classmethod
     def local(cls) -> "Chainspec":
-        return cls(value=ChainspecType.LOCAL)
+        return cls.model_construct(value=ChainspecType.LOCAL)
 
     @classmethod
     def dev(cls) -> "Chainspec":
-        return cls(value=ChainspecType.DEV)
+        return cls.model_construct(value=ChainspecType.DEV)
 
     @classmethod
     def from_path(cls, path: Union[str, Path]) -> "Chainspec":
-        return cls(value=Path(os.path.abspath(path)))
+        """
+        Chainspec for a file pysubnet generated itself. Only checks that the file exists,
+        the full JSON validation probe of `Chainspec(value=...)` is skipped since the file
+        is parsed by whoever consumes it anyway.
+        """
+        path = Path(os.path.abspath(path))
+        if not path.is_file():
+            raise ValueError(f"'{path}' is not a valid file path")
+        return cls.model_construct(value=path)
 
     def get_chainid(self) -> str:
         """Get the chain ID from the chainspec. Uses hardcoded values as present in default substrate node.
@@ -87,8 +237,12 @@ class Chainspec(BaseModel):
 
         elif isinstance(self.value, Path):
             try:
-                with self.value.open("r") as f:
-                    data = json.load(f)
+                # A parse of the file may already be around, otherwise avoid one
+                if not serialization.is_file_cached(self.value):
+                    chain_id = _scan_chain_id(self.value)
+                    if chain_id is not None:
+                        return chain_id
+                data = serialization.load_file_cached(self.value)
                 return data.get("id", "unknown")
             except (json.JSONDecodeError, OSError) as e:
                 # Pydantic will prevent this from happening, but just in case
@@ -96,18 +250,21 @@ class Chainspec(BaseModel):
 
         raise ValueError("Invalid chainspec value")
 
-    def get_chainid_with(self, substrate: Substrate) -> str:
-        """Get the chain ID directly from a generated chainspec file."""
-        c = substrate.run_command(
-            [
-                "build-spec",
-                "--chain",
-                str(self),
-                "--disable-default-bootnode",
-            ],
-            json=True,
+    def _build_spec_with(self, substrate: "Substrate", cwd=None) -> dict:
+        # Builtin chains only depend on the substrate build, so they can be cached across runs
+        return _build_spec(
+            substrate, str(self), persist=isinstance(self.value, ChainspecType), cwd=cwd
         )
 
+    def build_with(self, substrate: "Substrate", cwd=None) -> dict:
+        """Generate the chainspec with `substrate build-spec` run in `cwd`. The build runs
+        at most once per substrate and chainspec, the returned copy is safe to modify."""
+        return copy.deepcopy(self._build_spec_with(substrate, cwd=cwd))
+
+    def get_chainid_with(self, substrate: "Substrate", cwd=None) -> str:
+        """Get the chain ID directly from a generated chainspec file, see `build_with`."""
+        c = self._build_spec_with(substrate, cwd=cwd)
+
         chain_id = c.get("id")
         if not chain_id:
             raise ValueError(
@@ -119,9 +276,8 @@ class Chainspec(BaseModel):
         """Load the chainspec file into memory only if it's a path. Returns None otherwise."""
         if isinstance(self.value, Path):
             try:
-                with self.value.open("r") as f:
-                    data = json.load(f)
-                return data
+                # The caller owns the returned dict, take it out of the cache
+                return serialization.load_file_cached(self.value, take=True)
             except (json.JSONDecodeError, OSError) as e:
                 # Pydantic will prevent this from happening, but just in case
                 raise ValueError(f"Error reading chainspec file '{self.value}': {e}")
@@ -3,16 +3,21 @@ Definitions for handling chainspec files.
 Define your chainspec editors here.
 Use `load_chainspec` & `write_chainspec` for loading and writing chainspec files.
 Your editor looks like : <load_chainspec><your edits><write_chainspec>
+To apply several edits with a single load & write use `chainspec_session`:
+    with chainspec_session(path) as data: <your edits>
 Then include your handler in the main script before `start_network()` is called
 """
 
-import json
+from contextlib import contextmanager
+from operator import itemgetter
+
 from rich.console import Console
 from rich.prompt import IntPrompt
 from rich.panel import Panel
 
 from .accounts import AccountKeyType
 from .cli import CliConfig
+from .helpers import serialization
 
 console = Console()
 
@@ -22,17 +27,46 @@ def load_chainspec(chainspec: str):
     Load chainspec from a JSON file.
     Chainspec is expected to be an os.path at this stage
     """
-    with open(chainspec, "r") as f:
-        data = json.load(f)
-    return data
+    # Takes the dict `write_chainspec` kept if nothing touched the file since, instead of
+    # parsing it again. Each dict is handed over at most once so callers never share it
+    return serialization.load_file_cached(chainspec, take=True)
 
 
-def write_chainspec(chainspec: str, data):
+def write_chainspec(chainspec: str, data, *, pretty=False):
     """
     Write chainspec to a JSON file.
+    Written compact by default since the file is consumed by substrate,
+    pass `pretty=True` for indented human readable output.
+    `data` must not be modified by the caller afterwards, `load_chainspec` may return it.
+    """
+    serialization.dump_file(chainspec, data, pretty=pretty)
+    serialization.remember_file(chainspec, data)
+
+
+def aura_authorities(NODES: list[dict]) -> list:
+    """AURA authorities entry for `NODES`"""
+    return [node["aura-ss58"] for node in NODES]
+
+
+def babe_authorities(NODES: list[dict]) -> list:
+    """BABE authorities entry for `NODES`, as [authority_id, weight] pairs"""
+    return [[node["babe-ss58"], 1] for node in NODES]
+
+
+def grandpa_authorities(NODES: list[dict]) -> list:
+    """GRANDPA authorities entry for `NODES`, as [authority_id, weight] pairs"""
+    return [[node["grandpa-ss58"], 1] for node in NODES]
+
+
+@contextmanager
+def chainspec_session(chainspec: str):
+    """
+    Load chainspec once, yield it for in-memory edits and write it back once on exit.
+    Nothing is written if the body raises.
     """
-    with open(chainspec, "w") as f:
-        json.dump(data, f, indent=2)
+    data = load_chainspec(chainspec)
+    yield data
+    write_chainspec(chainspec, data)
 
 
 def edit_vs_ss_authorities(
@@ -40,6 +74,16 @@ def edit_vs_ss_authorities(
 ):
     """
     NOTE: This will overwrite `chainspec` passed in as argument.
+    See `apply_vs_ss_authorities` for the in-memory version.
+    """
+    with chainspec_session(chainspec) as data:
+        apply_vs_ss_authorities(data, NODES, account_key_type)
+
+
+def apply_vs_ss_authorities(
+    data, NODES: list[dict], account_key_type: AccountKeyType
+):
+    """
     A handler to edit a chainspec with the substrate-validator-set pallet + pallet-sessions
     This will insert the necessary keys into the genesis config of pallet-sessions and substrate-validator-set pallet
 
@@ -64,29 +108,19 @@ def edit_vs_ss_authorities(
               ]
             }
     """
-    data = load_chainspec(chainspec)
     genesis = data["genesis"]["runtimeGenesis"]["patch"]
     session = genesis["session"]
     validatorSet = genesis["validatorSet"]
-    # Remove existing keys
-    session["keys"] = []
-    validatorSet["initialValidators"] = []
     vkey = account_key_type.get_vkey()
-    # Insert keys into pallet-sessions
-    for node in NODES:
-        # Make entry for pallet-sessions
-        entry_sessions = [
-            node[vkey],
-            node[vkey],
-            {"aura": node["aura-ss58"], "grandpa": node["grandpa-ss58"]},
-        ]
-        session["keys"].append(entry_sessions)
-        # Make entry for substrate-validator-set pallet
-        entry_validatorSet = node[vkey]
-        validatorSet["initialValidators"].append(entry_validatorSet)
-
-    # Write the modified data back to the original file
-    write_chainspec(chainspec, data)
+    # Fetch (validator, aura, grandpa) for every node with C level lookups
+    rows = list(map(itemgetter(vkey, "aura-ss58", "grandpa-ss58"), NODES))
+    # Replace existing keys in pallet-sessions
+    session["keys"] = [
+        [validator, validator, {"aura": aura, "grandpa": grandpa}]
+        for validator, aura, grandpa in rows
+    ]
+    # Replace existing validators in substrate-validator-set pallet
+    validatorSet["initialValidators"] = [row[0] for row in rows]
 
 
 def inject_validator_balances(
@@ -163,27 +197,24 @@ def inject_validator_balances(
     unit = 10**tokenDecimals
     vkey = account_key_type.get_vkey()
 
-    # print(balances, type(balances))
+    # Mutate the chainspec's balances list in place
     if removeExisting:
-        balances = []
+        balances.clear()
     # Add initial balances for each node
     for node in NODES:
         current_amount = amount
         if includeNodeBalances:
-            # Check if node has a balance defined
-            if node.get("balance") is not None:
-                current_amount = node["balance"]
-        
+            # A balance defined on the node itself takes precedence
+            node_balance = node.get("balance")
+            if node_balance is not None:
+                current_amount = node_balance
+
         # Only inject balance if amount > 0
         if current_amount > 0:
+            validator = node[vkey]
             final_balance = current_amount * unit
-            entry = [
-                node[vkey],
-                final_balance,
-            ]
-            balances.append(entry)
-            console.print(f"[dim]{node[vkey]} --> {current_amount} tokens ({final_balance:,} units)[/dim]")
-    data["genesis"]["runtimeGenesis"]["patch"]["balances"]["balances"] = balances
+            balances.append([validator, final_balance])
+            console.print(f"[dim]{validator} --> {current_amount} tokens ({final_balance:,} units)[/dim]")
 
 
 def enable_poa(chainspec: str, config: CliConfig):
@@ -193,21 +224,10 @@ def enable_poa(chainspec: str, config: CliConfig):
     """
     data = load_chainspec(chainspec)
     try:
+        genesis = data["genesis"]["runtimeGenesis"]["patch"]
         # Add PoA specific configurations
-        aura_authorities = []
-        gran_authorities = []
-        for node in config.nodes:
-            entry_aura = node["aura-ss58"]
-            aura_authorities.append(entry_aura)
-            entry_grandpa = [node["grandpa-ss58"], 1]
-            gran_authorities.append(entry_grandpa)
-
-        data["genesis"]["runtimeGenesis"]["patch"]["aura"]["authorities"] = (
-            aura_authorities
-        )
-        data["genesis"]["runtimeGenesis"]["patch"]["grandpa"]["authorities"] = (
-            gran_authorities
-        )
+        genesis["aura"]["authorities"] = aura_authorities(config.nodes)
+        genesis["grandpa"]["authorities"] = grandpa_authorities(config.nodes)
         apply_config_customizations(data, config)
     except KeyError as e:
         print(
@@ -224,26 +244,16 @@ def enable_poa_with_validator_set(chainspec: str, config: CliConfig):
     plus ValidatorSet and Sessions configuration.
     This ensures compatibility with substrate-validator-set and session pallets.
     """
-    # First, apply the validator set and sessions configuration
-    edit_vs_ss_authorities(chainspec, config.nodes, config.account_key_type)
-
-    # Load the chainspec to add AURA and GRANDPA authorities
     data = load_chainspec(chainspec)
 
-    try:
-        # Add AURA and GRANDPA authorities (essential for consensus)
-        aura_authorities = []
-        gran_authorities = []
-
-        for node in config.nodes:
-            entry_aura = node["aura-ss58"]
-            aura_authorities.append(entry_aura)
-            entry_grandpa = [node["grandpa-ss58"], 1]
-            gran_authorities.append(entry_grandpa)
+    # First, apply the validator set and sessions configuration
+    apply_vs_ss_authorities(data, config.nodes, config.account_key_type)
 
-        # Ensure AURA and GRANDPA authorities are set
-        data["genesis"]["runtimeGenesis"]["patch"]["aura"]["authorities"] = aura_authorities
-        data["genesis"]["runtimeGenesis"]["patch"]["grandpa"]["authorities"] = gran_authorities
+    try:
+        genesis = data["genesis"]["runtimeGenesis"]["patch"]
+        # Ensure AURA and GRANDPA authorities are set (essential for consensus)
+        genesis["aura"]["authorities"] = aura_authorities(config.nodes)
+        genesis["grandpa"]["authorities"] = grandpa_authorities(config.nodes)
 
         # Check if tokenDecimals is defined, if not use 18 decimals as default
         tokenDecimals = data["properties"].get("tokenDecimals", 18)
@@ -276,42 +286,42 @@ def custom_network_config(chainspec: str, config: CliConfig):
     Modify the chainspec for custom network configuration.
     Use this function to write one for your own chain.
     """
-    edit_vs_ss_authorities(
-        chainspec, config.nodes, config.account_key_type
-    )  # Custom handler for a particular chain using substrate-validator-set and pallet-session
-    data = load_chainspec(chainspec)
-    # Check if tokenDecimals is defined, if not use 18 decimals as default
-    tokenDecimals = data["properties"].get("tokenDecimals", 18)
-    inject_validator_balances(
-        data,
-        config.nodes,
-        config.account_key_type,
-        removeExisting=True,  # Remove Existing balances
-        amount=5234,  # Balance
-        tokenDecimals=tokenDecimals,
-    )  # Custom handler for setting balances genesis
-    apply_config_customizations(data, config)
-    write_chainspec(chainspec, data)
+    with chainspec_session(chainspec) as data:
+        apply_vs_ss_authorities(
+            data, config.nodes, config.account_key_type
+        )  # Custom handler for a particular chain using substrate-validator-set and pallet-session
+        # Check if tokenDecimals is defined, if not use 18 decimals as default
+        tokenDecimals = data["properties"].get("tokenDecimals", 18)
+        inject_validator_balances(
+            data,
+            config.nodes,
+            config.account_key_type,
+            removeExisting=True,  # Remove Existing balances
+            amount=5234,  # Balance
+            tokenDecimals=tokenDecimals,
+        )  # Custom handler for setting balances genesis
+        apply_config_customizations(data, config)
 
 
 def apply_config_customizations(data, config: CliConfig):
     if not config.apply_chainspec_customizations:
         return
-    fetched_tokenSymbol = data["properties"].get("tokenSymbol", None)
-    fetched_tokenDecimals = data["properties"].get("tokenDecimals", None)
+    properties = data["properties"]
+    fetched_tokenSymbol = properties.get("tokenSymbol", None)
+    fetched_tokenDecimals = properties.get("tokenDecimals", None)
     network = config.network
     if network is not None:
         # config file customizations are selected thus we use them
         tokenDecimals = network.token_decimal or fetched_tokenDecimals
         tokenSymbol = network.token_symbol or fetched_tokenSymbol
-        data["properties"]["tokenDecimals"] = (
+        properties["tokenDecimals"] = (
             tokenDecimals or 18
         )  # Neither defined in chainspec or config -- unlikely but we cover it
-        data["properties"]["tokenSymbol"] = tokenSymbol or "DOT"  # same as above
+        properties["tokenSymbol"] = tokenSymbol or "DOT"  # same as above
         
         # Set ss58Format if specified in chain config
         if network.chain.number is not None:
-            data["properties"]["ss58Format"] = network.chain.number
+            properties["ss58Format"] = network.chain.number
         
         inject_validator_balances(
             data,
@@ -332,29 +342,20 @@ def enable_babe_grandpa(chainspec: str, config: CliConfig):
     """
     data = load_chainspec(chainspec)
     try:
-        # Add BABE specific configurations
-        babe_authorities = []
-        gran_authorities = []
-
-        for node in config.nodes:
-            # BABE authorities use the BABE keys
-            entry_babe = [node["babe-ss58"], 1]  # [authority_id, weight]
-            babe_authorities.append(entry_babe)
-
-            # GRANDPA authorities remain the same
-            entry_grandpa = [node["grandpa-ss58"], 1]
-            gran_authorities.append(entry_grandpa)
-
-        data["genesis"]["runtimeGenesis"]["patch"]["babe"]["authorities"] = babe_authorities
-        data["genesis"]["runtimeGenesis"]["patch"]["grandpa"]["authorities"] = gran_authorities
+        genesis = data["genesis"]["runtimeGenesis"]["patch"]
+        babe = genesis["babe"]
+        # Add BABE specific configurations, BABE authorities use the BABE keys
+        babe["authorities"] = babe_authorities(config.nodes)
+        # GRANDPA authorities remain the same
+        genesis["grandpa"]["authorities"] = grandpa_authorities(config.nodes)
 
         # BABE specific configuration - set epoch duration (in blocks)
-        if "epochDuration" not in data["genesis"]["runtimeGenesis"]["patch"]["babe"]:
-            data["genesis"]["runtimeGenesis"]["patch"]["babe"]["epochDuration"] = 2400  # ~4 hours with 6s blocks
+        if "epochDuration" not in babe:
+            babe["epochDuration"] = 2400  # ~4 hours with 6s blocks
         
         # BABE epoch configuration - required for proper BABE consensus
-        if "epochConfig" not in data["genesis"]["runtimeGenesis"]["patch"]["babe"]:
-            data["genesis"]["runtimeGenesis"]["patch"]["babe"]["epochConfig"] = {
+        if "epochConfig" not in babe:
+            babe["epochConfig"] = {
                 "allowed_slots": "PrimaryAndSecondaryPlainSlots",
                 "c": [1, 4]
             }
@@ -380,27 +381,19 @@ def enable_babe_grandpa_with_staking(chainspec: str, config: CliConfig):
     data = load_chainspec(chainspec)
     
     try:
-        # Add BABE and GRANDPA authorities (essential for consensus)
-        babe_authorities = []
-        gran_authorities = []
-        
-        for node in config.nodes:
-            entry_babe = [node["babe-ss58"], 1]  # [authority_id, weight]
-            babe_authorities.append(entry_babe)
-            entry_grandpa = [node["grandpa-ss58"], 1]
-            gran_authorities.append(entry_grandpa)
-
-        # Set BABE and GRANDPA authorities
-        data["genesis"]["runtimeGenesis"]["patch"]["babe"]["authorities"] = babe_authorities
-        data["genesis"]["runtimeGenesis"]["patch"]["grandpa"]["authorities"] = gran_authorities
+        genesis = data["genesis"]["runtimeGenesis"]["patch"]
+        babe = genesis["babe"]
+        # Set BABE and GRANDPA authorities (essential for consensus)
+        babe["authorities"] = babe_authorities(config.nodes)
+        genesis["grandpa"]["authorities"] = grandpa_authorities(config.nodes)
         
         # BABE specific configuration
-        if "epochDuration" not in data["genesis"]["runtimeGenesis"]["patch"]["babe"]:
-            data["genesis"]["runtimeGenesis"]["patch"]["babe"]["epochDuration"] = 2400
+        if "epochDuration" not in babe:
+            babe["epochDuration"] = 2400
         
         # BABE epoch configuration - required for proper BABE consensus
-        if "epochConfig" not in data["genesis"]["runtimeGenesis"]["patch"]["babe"]:
-            data["genesis"]["runtimeGenesis"]["patch"]["babe"]["epochConfig"] = {
+        if "epochConfig" not in babe:
+            babe["epochConfig"] = {
                 "allowed_slots": "PrimaryAndSecondaryPlainSlots",
                 "c": [1, 4]
             }
@@ -446,17 +439,16 @@ def configure_sessions_for_staking(data, NODES: list[dict], account_key_type: Ac
         genesis["session"] = {}
     
     session = genesis["session"]
-    session["keys"] = []
     vkey = account_key_type.get_vkey()
     
-    # Insert session keys with BABE
-    for node in NODES:
-        entry_sessions = [
-            node[vkey],  # validator account
-            node[vkey],  # session account (can be the same)
-            {"babe": node["babe-ss58"], "grandpa": node["grandpa-ss58"]},
-        ]
-        session["keys"].append(entry_sessions)
+    # Replace session keys with BABE ones:
+    # [validator account, session account (can be the same), keys]
+    session["keys"] = [
+        [validator, validator, {"babe": babe, "grandpa": grandpa}]
+        for validator, babe, grandpa in map(
+            itemgetter(vkey, "babe-ss58", "grandpa-ss58"), NODES
+        )
+    ]
 
 
 def configure_staking_genesis(data, NODES: list[dict], account_key_type: AccountKeyType):
@@ -497,37 +489,35 @@ def configure_staking_genesis(data, NODES: list[dict], account_key_type: Account
 
 def edit_babe_vs_ss_authorities(
     chainspec: str, NODES: list[dict], account_key_type: AccountKeyType
+):
+    """
+    NOTE: This will overwrite `chainspec` passed in as argument.
+    See `apply_babe_vs_ss_authorities` for the in-memory version.
+    """
+    with chainspec_session(chainspec) as data:
+        apply_babe_vs_ss_authorities(data, NODES, account_key_type)
+
+
+def apply_babe_vs_ss_authorities(
+    data, NODES: list[dict], account_key_type: AccountKeyType
 ):
     """
     Handler to edit a chainspec with BABE + substrate-validator-set pallet + pallet-sessions.
-    Similar to edit_vs_ss_authorities but uses BABE instead of AURA for session keys.
+    Similar to apply_vs_ss_authorities but uses BABE instead of AURA for session keys.
     """
-    data = load_chainspec(chainspec)
     genesis = data["genesis"]["runtimeGenesis"]["patch"]
     session = genesis["session"]
     validatorSet = genesis["validatorSet"]
-
-    # Remove existing keys
-    session["keys"] = []
-    validatorSet["initialValidators"] = []
     vkey = account_key_type.get_vkey()
-
-    # Insert keys into pallet-sessions with BABE
-    for node in NODES:
-        # Make entry for pallet-sessions with BABE instead of AURA
-        entry_sessions = [
-            node[vkey],
-            node[vkey],
-            {"babe": node["babe-ss58"], "grandpa": node["grandpa-ss58"]},
-        ]
-        session["keys"].append(entry_sessions)
-
-        # Make entry for substrate-validator-set pallet
-        entry_validatorSet = node[vkey]
-        validatorSet["initialValidators"].append(entry_validatorSet)
-
-    # Write the modified data back to the original file
-    write_chainspec(chainspec, data)
+    # Fetch (validator, babe, grandpa) for every node with C level lookups
+    rows = list(map(itemgetter(vkey, "babe-ss58", "grandpa-ss58"), NODES))
+    # Replace existing keys in pallet-sessions, with BABE instead of AURA
+    session["keys"] = [
+        [validator, validator, {"babe": babe, "grandpa": grandpa}]
+        for validator, babe, grandpa in rows
+    ]
+    # Replace existing validators in substrate-validator-set pallet
+    validatorSet["initialValidators"] = [row[0] for row in rows]
 
 
 def enable_dev_mode(chainspec: str, config: CliConfig):
@@ -541,18 +531,13 @@ def enable_dev_mode(chainspec: str, config: CliConfig):
         # Use only the first node for development
         first_node = config.nodes[0]
 
+        genesis = data["genesis"]["runtimeGenesis"]["patch"]
         # Set single authority for both AURA and GRANDPA
-        data["genesis"]["runtimeGenesis"]["patch"]["aura"]["authorities"] = [
-            first_node["aura-ss58"]
-        ]
-        data["genesis"]["runtimeGenesis"]["patch"]["grandpa"]["authorities"] = [
-            [first_node["grandpa-ss58"], 1]
-        ]
+        genesis["aura"]["authorities"] = [first_node["aura-ss58"]]
+        genesis["grandpa"]["authorities"] = [[first_node["grandpa-ss58"], 1]]
 
         # Set development mode specific configurations
-        if "properties" not in data:
-            data["properties"] = {}
-        data["properties"]["isEthereum"] = False
+        data.setdefault("properties", {})["isEthereum"] = False
 
         # Apply config customizations
         apply_config_customizations(data, config)
@@ -585,6 +570,7 @@ def inject_config_balances(data, config: CliConfig):
     if not has_balances:
         return
 
+    # Entries are appended to the chainspec's balances list in place
     balances = data["genesis"]["runtimeGenesis"]["patch"]["balances"]["balances"]
     tokenDecimals = data["properties"].get("tokenDecimals", None)
     
@@ -675,9 +661,6 @@ def inject_config_balances(data, config: CliConfig):
             balances.append(entry)
             console.print(f"[dim]{address} --> {balance_amount} tokens ({final_balance:,} units)[/dim]")
 
-    # Update the balances in the data
-    data["genesis"]["runtimeGenesis"]["patch"]["balances"]["balances"] = balances
-
 
 def display_chain_customizations(config: CliConfig, chainspec_data):
     """
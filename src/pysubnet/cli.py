@@ -3,17 +3,51 @@ import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from pprint import pprint
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Dict, TYPE_CHECKING
 
-from pysubnet.helpers.config import NetworkConfig, load_config, load_nodes_from_config
-from pysubnet.helpers.substrate import Substrate
 from .accounts import AccountKeyType
 from .chainspec import Chainspec
 
+if TYPE_CHECKING:
+    from pysubnet.helpers.config import NetworkConfig
+    from pysubnet.helpers.substrate import Substrate
+
+# Nodes used when no config file is provided. Read-only, `CliConfig` gets its own copies
+_DEFAULT_NODES = tuple(
+    MappingProxyType(node)
+    for node in (
+        {
+            "name": "alice",
+            "p2p-port": 30333,
+            "rpc-port": 9944,
+            "prometheus-port": 9615,
+        },
+        {
+            "name": "bob",
+            "p2p-port": 30334,
+            "rpc-port": 9945,
+            "prometheus-port": 9616,
+        },
+        {
+            "name": "charlie",
+            "p2p-port": 30335,
+            "rpc-port": 9946,
+            "prometheus-port": 9617,
+        },
+        {
+            "name": "david",
+            "p2p-port": 30336,
+            "rpc-port": 9947,
+            "prometheus-port": 9618,
+        },
+    )
+)
+
 
 @dataclass
 class CliConfig:
-    network: NetworkConfig = None
+    network: "NetworkConfig" = None
     apply_chainspec_customizations: bool = False
     interactive: bool = False
     run_network: bool = False
@@ -21,38 +55,12 @@ class CliConfig:
     clean: bool = False
     chainspec: Chainspec = field(default_factory=Chainspec.local)
     raw_chainspec: Path = None  # Is generated by us so is a fs path
-    substrate: Substrate = None
+    substrate: "Substrate" = None
     docker_subnet: str = "172.28.0.0/16"
     account_key_type: AccountKeyType = None
     poa: bool = False
-    nodes: List[Dict] = field(
-        default_factory=lambda: [
-            {
-                "name": "alice",
-                "p2p-port": 30333,
-                "rpc-port": 9944,
-                "prometheus-port": 9615,
-            },
-            {
-                "name": "bob",
-                "p2p-port": 30334,
-                "rpc-port": 9945,
-                "prometheus-port": 9616,
-            },
-            {
-                "name": "charlie",
-                "p2p-port": 30335,
-                "rpc-port": 9946,
-                "prometheus-port": 9617,
-            },
-            {
-                "name": "david",
-                "p2p-port": 30336,
-                "rpc-port": 9947,
-                "prometheus-port": 9618,
-            },
-        ]
-    )
+    strict: bool = False
+    nodes: List[Dict] = field(default_factory=lambda: [dict(n) for n in _DEFAULT_NODES])
 
 
 def parse_args() -> CliConfig:
@@ -102,8 +110,8 @@ def parse_args() -> CliConfig:
     )
     parser.add_argument(
         "--account",
-        type=AccountKeyType.from_string,
-        choices=list(AccountKeyType),
+        type=str.lower,
+        choices=[e.value for e in AccountKeyType],
         help="Type of account key ('ecdsa' for Ethereum-style, 'sr25519' for Substrate-style, defaults to ecdsa if not passed)",
     )
     parser.add_argument(
@@ -112,18 +120,32 @@ def parse_args() -> CliConfig:
         default=False,
         help="Enable Substrate-node-template PoA mode, i.e. assign all authorities equal weight in chainspec",
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        default=False,
+        help="Insert keystore keys with `substrate key insert` instead of writing the keystore files directly",
+    )
     # !! WARNING: argsparse will actually set non-supplied flags to None! This works for boolean values but
     # for others it can lead to uncaught bugs! Hence use + <default value> unless a default is provided
     # in argsparse itself. We explicitly specify defaults for argparse itself so `or <default_val>` not required here
     args = parser.parse_args()
 
+    # Deferred so that `--help` and argument errors exit before the docker SDK and config file
+    # parsing are imported. `pysubnet.helpers` re-exports `.config` lazily for the same reason
+    from pysubnet.helpers.config import load_config, load_nodes_from_config
+    from pysubnet.helpers.substrate import Substrate
+
     config = CliConfig(
         interactive=args.interactive,
         run_network=args.run_network,
         root_dir=os.path.abspath(args.root),
         clean=args.clean,
-        account_key_type=args.account,
+        account_key_type=AccountKeyType.from_string(args.account)
+        if args.account is not None
+        else None,
         poa=args.poa,
+        strict=args.strict,
     )
     if args.bin is not None:
         config.substrate = Substrate(args.bin)
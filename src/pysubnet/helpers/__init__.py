@@ -2,7 +2,18 @@
 from pathlib import Path
 from .process import parse_subkey_output, run_command
 from .prompts import prompt_str, prompt_path, prompt_bool
-from .config import load_config, PySubnetConfig, NetworkConfig, NodeConfig
+
+# Re-exported from `.config` on first access, so importing `pysubnet.helpers` doesn't
+# pull in the config file parsing (tomli, config models) before it is needed
+_CONFIG_EXPORTS = ("load_config", "PySubnetConfig", "NetworkConfig", "NodeConfig")
+
+
+def __getattr__(name: str):
+    if name in _CONFIG_EXPORTS:
+        from . import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def l2_seg(path: str) -> str:
@@ -30,5 +41,5 @@ __all__ = [
     "PySubnetConfig",
     "NetworkConfig",
     "NodeConfig",
-    l2_seg,
+    "l2_seg",
 ]
@@ -2,28 +2,66 @@ import re
 import subprocess
 
 
-def run_command(command, cwd=None):
+def run_command(command, cwd=None, capture=True):
     """
-    Runs a command in a given directory
+    Runs a command in a given directory.
+    With `capture=False` stdout is discarded instead of buffered, stderr is always
+    captured for the error message.
     """
-    result = subprocess.run(command, capture_output=True, text=True, cwd=cwd)
+    result = subprocess.run(
+        command,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd,
+    )
     if result.returncode != 0:
         raise Exception(f"Command failed: {' '.join(command)}\n{result.stderr}")
     return result
 
 
+def run_command_to_file(command, output_path, cwd=None):
+    """
+    Runs a command in a given directory, streaming its stdout straight into `output_path`.
+    stderr is only captured for the error message.
+    """
+    with open(output_path, "wb") as f:
+        result = subprocess.run(command, stdout=f, stderr=subprocess.PIPE, cwd=cwd)
+    if result.returncode != 0:
+        raise Exception(
+            f"Command failed: {' '.join(map(str, command))}\n"
+            f"{result.stderr.decode('utf-8', errors='replace')}"
+        )
+    return result
+
+
+# One `Label:   value` line of subkey output, for the fields we care about
+_SUBKEY_FIELD_RE = re.compile(
+    r"^\s*(Secret phrase|Secret seed|Public key \(hex\)|Public key \(SS58\)|Account ID):"
+    r"[ \t]+(\S.*?)\s*$",
+    re.MULTILINE,
+)
+_SUBKEY_REQUIRED_FIELDS = (
+    "Secret seed",
+    "Public key (hex)",
+    "Public key (SS58)",
+    "Account ID",
+)
+
+
 def parse_subkey_output(output):
-    """Parses subkey output"""
+    """Parses subkey output in a single scan"""
+    fields = dict(_SUBKEY_FIELD_RE.findall(output))
+    missing = [label for label in _SUBKEY_REQUIRED_FIELDS if label not in fields]
+    if missing:
+        raise ValueError(f"Unexpected subkey output, missing {missing}:\n{output}")
+    phrase = fields.get("Secret phrase")
     return {
-        "secret_phrase": " ".join(
-            output.split("Secret phrase:")[1].split()[:12]
-        ).strip()
-        if "Secret phrase:" in output
-        else None,
-        "secret": output.split("Secret seed:")[1].split()[0].strip(),
-        "public_key": output.split("Public key (hex):")[1].split()[0].strip(),
-        "ss58_address": output.split("Public key (SS58):")[1].split()[0].strip(),
-        "account_id": output.split("Account ID:")[1].split()[0].strip(),
+        "secret_phrase": " ".join(phrase.split()[:12]) if phrase else None,
+        "secret": fields["Secret seed"].split()[0],
+        "public_key": fields["Public key (hex)"].split()[0],
+        "ss58_address": fields["Public key (SS58)"].split()[0],
+        "account_id": fields["Account ID"].split()[0],
     }
 
 
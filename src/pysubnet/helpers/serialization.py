@@ -0,0 +1,189 @@
+"""
+JSON helpers for chainspec sized payloads.
+
+Uses `orjson` when it is installed (`pip install pysubnet[fast]`) and falls back
+to the stdlib `json` module otherwise.
+
+NOTE: orjson parses integers that don't fit in 64 bits as floats. Chainspec balances
+are u128 and routinely exceed that (e.g. 5234 tokens with 18 decimals), so any payload
+containing such a number is handed to the stdlib parser which keeps arbitrary precision ints.
+"""
+
+import io
+import json
+from contextlib import contextmanager
+import mmap
+import os
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are memory-mapped instead of read into a bytes buffer
+MMAP_THRESHOLD = 256 * 1024 * 1024
+# Write buffer for the streaming stdlib encoder
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# A JSON number token of 20+ digits, i.e. one that may not fit in 64 bits.
+# Requiring a structural character before the digits skips hex strings (wasm code, keys)
+_BIG_INT_BYTES = re.compile(rb"[\[:,]\s*-?\d{20}")
+_BIG_INT_STR = re.compile(r"[\[:,]\s*-?\d{20}")
+
+
+def _orjson_safe(data) -> bool:
+    """Returns True if `data` can be parsed by orjson without losing integer precision"""
+    if orjson is None:
+        return False
+    pattern = _BIG_INT_STR if isinstance(data, str) else _BIG_INT_BYTES
+    return pattern.search(data) is None
+
+
+def loads(data):
+    """
+    Parse JSON from `str`, `bytes` or any bytes-like buffer (e.g. an mmap).
+    """
+    if _orjson_safe(data):
+        return orjson.loads(data)
+    if not isinstance(data, (str, bytes, bytearray)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def load_file(path):
+    """
+    Load a JSON file. Large files are memory-mapped so the kernel pages them in on demand
+    instead of copying the whole file into a Python buffer first.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is not None and size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _orjson_safe(mm):
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                return json.loads(mm[:])
+        return loads(f.read())
+
+
+# abs path -> ((mtime_ns, size), data) of JSON files whose parsed contents are kept for
+# reuse, see `load_file_cached`. Entries are only valid while the file is unchanged
+_file_cache = {}
+
+
+def stat_key(path) -> tuple:
+    """(mtime_ns, size) of the file at `path`, changes whenever the file is rewritten"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load_file_cached(path, take: bool = False):
+    """
+    `load_file`, reusing the contents kept by an earlier call or `remember_file` as long
+    as the file is unchanged. Callers that modify the result must `take` it, which hands
+    the contents over and drops them from the cache so a dict is never shared.
+    """
+    path = os.path.abspath(path)
+    key = stat_key(path)
+    if take:
+        cached = _file_cache.pop(path, None)
+    else:
+        cached = _file_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = load_file(path)
+    if not take:
+        _file_cache[path] = (key, data)
+    return data
+
+
+def remember_file(path, data):
+    """
+    Keep `data` as the contents of the JSON file at `path` for `load_file_cached`, e.g.
+    right after writing it. `data` must not be modified by the caller afterwards.
+    """
+    path = os.path.abspath(path)
+    _file_cache[path] = (stat_key(path), data)
+
+
+def is_file_cached(path) -> bool:
+    """Returns True if contents for `path` are kept, they may still be stale"""
+    return os.path.abspath(path) in _file_cache
+
+
+def forget_files():
+    """Drop all contents kept for `load_file_cached`, chainspecs can be large"""
+    _file_cache.clear()
+
+
+def _stdlib_kwargs(pretty: bool) -> dict:
+    """Stdlib `json` encoder options matching the orjson output for `pretty`"""
+    if pretty:
+        return {"indent": 2}
+    # Only one shot json.dumps without indent runs the C encoder, see `dump_file`
+    return {"separators": (",", ":")}
+
+
+def _orjson_dumps(data, pretty: bool):
+    """Returns the orjson encoding of `data` or None if orjson can't encode it"""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    except TypeError:
+        # orjson refuses integers wider than 64 bits, let the stdlib handle them
+        return None
+
+
+def dumps(data, pretty: bool = True) -> bytes:
+    """
+    Serialize `data` to UTF-8 encoded JSON, with 2 space indentation if `pretty` else compact.
+    """
+    buf = _orjson_dumps(data, pretty)
+    if buf is not None:
+        return buf
+    return json.dumps(data, **_stdlib_kwargs(pretty)).encode("utf-8")
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    Yields a temporary path next to `path` to write to. It is moved over `path` with
+    `os.replace` once the block completes, and removed if the block raises, so `path`
+    never holds a partially written file (e.g. after Ctrl+C during a large write).
+    """
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def dump_file(path, data, pretty: bool = True):
+    """
+    Atomically write `data` as JSON to `path`, see `dumps` for `pretty` and `atomic_path`.
+    orjson output and compact stdlib output are encoded in one shot (the latter by the
+    stdlib's C encoder) and written with a single write. Indented stdlib output is always
+    encoded in pure Python, so it is streamed chunk by chunk into a large write buffer
+    instead of being materialized as one string next to `data`.
+    """
+    with atomic_path(path) as tmp_path:
+        buf = _orjson_dumps(data, pretty)
+        if buf is None and not pretty:
+            # JSONEncoder.iterencode always takes the pure Python path, json.dumps doesn't
+            buf = json.dumps(data, **_stdlib_kwargs(pretty)).encode("utf-8")
+        if buf is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(buf)
+            return
+        encoder = json.JSONEncoder(**_stdlib_kwargs(pretty))
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as raw, io.TextIOWrapper(
+            raw, encoding="utf-8", write_through=False
+        ) as f:
+            f.writelines(encoder.iterencode(data))
@@ -1,7 +1,10 @@
 import os
 import re
+import shlex
+import signal
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
 import time
@@ -17,11 +20,36 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 if TYPE_CHECKING:
     from pysubnet.cli import CliConfig
 
-from .process import is_valid_public_key, parse_subkey_output, run_command
+from .process import (
+    is_valid_public_key,
+    parse_subkey_output,
+    run_command,
+    run_command_to_file,
+)
+from . import serialization
 import json as json_lib
 
 console = Console()
 
+# Seconds stopping local nodes get to exit after SIGTERM before they are killed.
+# Containers keep docker's own default grace period
+NODE_SHUTDOWN_TIMEOUT = 2
+
+# Printed after each command by `Substrate.run_commands` to split the combined output
+BATCH_SEPARATOR = "--- pysubnet batch separator ---"
+
+
+def _open_log(path) -> int:
+    """
+    Open a node log file for appending and return the raw fd, hinting the kernel that it
+    is written sequentially. No Python file object or buffer is set up in front of it.
+    The fd is non-inheritable (PEP 446), it is only passed on to a node explicitly.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return fd
+
 
 class ExecType(str, Enum):
     BIN = "bin"
@@ -166,15 +194,29 @@ class Substrate:
     def source(self) -> str:
         return self.config.source
 
+    @property
+    def fingerprint(self) -> str:
+        """Identifies the exact substrate build, changes whenever the binary or image does"""
+        if self.is_bin:
+            st = os.stat(self.source)
+            return f"bin:{self.source}:{st.st_mtime_ns}:{st.st_size}"
+        return f"docker:{docker.from_env().images.get(self.source).id}"
+
     def __repr__(self):
         return f"<Substrate source={self.source!r} exec_type={self.exec_type.value}>"
 
-    def run_command(self, command_args: List[str], cwd=None, json=False):
+    def run_command(self, command_args: List[str], cwd=None, json=False, capture=True):
+        """
+        Runs a substrate command. Pass `capture=False` when stdout isn't needed so it
+        is discarded rather than buffered (local binaries only).
+        """
         if self.exec_type == ExecType.BIN:
-            result = run_command([self.source, *command_args], cwd=cwd)
+            result = run_command(
+                [self.source, *command_args], cwd=cwd, capture=capture or json
+            )
             if json:
                 try:
-                    return json_lib.loads(result.stdout)
+                    return serialization.loads(result.stdout)
                 except json_lib.JSONDecodeError:
                     raise ValueError(f"Failed to parse JSON output: {result.stdout}")
             return {
@@ -242,8 +284,7 @@ class Substrate:
                         raise RuntimeError(f"Container exited with code {exit_code}")
 
                     # Read and parse JSON
-                    with open(tmp_json_path, "r") as f:
-                        json_data = json_lib.load(f)
+                    json_data = serialization.load_file(tmp_json_path)
                     os.remove(tmp_json_path)
                     return json_data
 
@@ -267,6 +308,103 @@ class Substrate:
                 )
                 return {"stdout": result.decode("utf-8")}
 
+    def run_command_to_file(self, command_args: List[str], output_path, cwd=None):
+        """
+        Runs a substrate command and streams its stdout into `output_path` without
+        buffering it in Python. Useful for large outputs like `build-spec --raw`.
+        `output_path` is replaced atomically, it is never left partially written.
+        """
+        with serialization.atomic_path(output_path) as tmp_path:
+            if self.exec_type == ExecType.BIN:
+                run_command_to_file([self.source, *command_args], tmp_path, cwd=cwd)
+            else:
+                self._run_container_to_file(command_args, tmp_path, cwd=cwd)
+        return output_path
+
+    def _run_container_to_file(self, command_args: List[str], output_path, cwd=None):
+        """Docker side of `run_command_to_file`"""
+        client = docker.from_env()
+        image_info = client.api.inspect_image(self.source)
+        default_entrypoint = image_info.get("Config", {}).get("Entrypoint", []) or []
+
+        docker_mount_path = "/workspace"
+        docker_output_mount_path = "/output"
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        volumes = {
+            output_dir: {"bind": docker_output_mount_path, "mode": "rw"},
+        }
+        if cwd:
+            if os.path.abspath(cwd) == output_dir:
+                docker_output_mount_path = docker_mount_path
+                volumes = {}
+            volumes[os.path.abspath(cwd)] = {"bind": docker_mount_path, "mode": "rw"}
+        docker_output_path = (
+            f"{docker_output_mount_path}/{os.path.basename(output_path)}"
+        )
+
+        # Let the container shell redirect stdout into the mounted output file
+        cmd = (
+            shlex.join([*default_entrypoint, *command_args])
+            + f" > {shlex.quote(docker_output_path)}"
+        )
+        container = client.containers.run(
+            image=self.source,
+            entrypoint=["/bin/sh", "-c"],
+            command=[cmd],
+            volumes=volumes,
+            working_dir=docker_mount_path if cwd else docker_output_mount_path,
+            detach=True,
+        )
+        result = container.wait()
+        exit_code = result.get("StatusCode", 0)
+        if exit_code != 0:
+            logs = container.logs(stdout=False, stderr=True).decode("utf-8", "replace")
+            container.remove()
+            raise RuntimeError(f"Container exited with code {exit_code}\n{logs}")
+        container.remove()
+
+    def run_commands(self, commands: List[List[str]], cwd=None) -> List[str]:
+        """
+        Runs several substrate commands, in order, within a single shell invocation so that
+        only one process (or one container for DOCKER) is spawned from Python for all of them.
+        Aborts on the first failing command.
+
+        Returns:
+            List[str]: stdout of each command
+        """
+        if self.is_bin and os.name == "nt":
+            # No POSIX shell to batch with, run them one by one
+            return [self.run_command(args, cwd=cwd)["stdout"] for args in commands]
+
+        if self.is_bin:
+            entrypoint = [self.source]
+        else:
+            client = docker.from_env()
+            image_info = client.api.inspect_image(self.source)
+            entrypoint = image_info.get("Config", {}).get("Entrypoint", []) or []
+
+        script = "set -e\n" + "".join(
+            f"{shlex.join([*entrypoint, *args])}\necho '{BATCH_SEPARATOR}'\n"
+            for args in commands
+        )
+
+        if self.is_bin:
+            stdout = run_command(["/bin/sh", "-c", script], cwd=cwd).stdout
+        else:
+            stdout = client.containers.run(
+                self.source,
+                [script],
+                entrypoint=["/bin/sh", "-c"],
+                remove=True,
+                stdout=True,
+                stderr=False,
+                volumes={cwd: {"bind": "/workspace", "mode": "rw"}} if cwd else None,
+                working_dir="/workspace" if cwd else None,
+            ).decode("utf-8")
+
+        # Every command's output is followed by a separator line, drop the trailing empty chunk
+        return stdout.split(f"{BATCH_SEPARATOR}\n")[: len(commands)]
+
     def _display_network_status(self, config: "CliConfig"):
         """Show network status with rich table"""
         console.print(
@@ -281,17 +419,17 @@ class Substrate:
         table.add_column("Log File", style="magenta")
         table.add_column("Explorer Link", style="green")
 
-        for node in config.nodes:
-            # Determine if config.root_dir is in the current working directory
-            cwd = os.getcwd()
-            abs_root_dir = os.path.abspath(config.root_dir)
-            if abs_root_dir.startswith(cwd):
-                root_dir_display = os.path.basename(abs_root_dir)
-            else:
-                root_dir_display = abs_root_dir
+        # Determine if config.root_dir is in the current working directory
+        abs_root_dir = os.path.abspath(config.root_dir)
+        if abs_root_dir.startswith(os.getcwd()):
+            root_dir_display = os.path.basename(abs_root_dir)
+        else:
+            root_dir_display = abs_root_dir
 
+        for node in config.nodes:
+            # Display the log file opened in start_network relative to root_dir_display
             log_path = os.path.join(
-                root_dir_display, node["name"], f"{node['name']}.log"
+                root_dir_display, os.path.relpath(node["log_path"], abs_root_dir)
             )
             explorer_link = f"https://polkadot.js.org/apps/?rpc=ws%3A%2F%2F127.0.0.1%3A{node['rpc-port']}#/explorer"
             table.add_row(
@@ -300,76 +438,94 @@ class Substrate:
 
         console.print(table)
 
+    def _spawn_node(self, config: "CliConfig", node: Dict[str, Any]) -> Dict[str, Any]:
+        """Launch a single local node process with its log files"""
+        # Ensure node directory exists
+        os.makedirs(node["base_path"], exist_ok=True)
+
+        # Absolute paths only, so no cwd is needed (see Popen below)
+        cmd = [
+            self.source,
+            "--base-path",
+            node["base_path"],
+            "--chain",
+            os.path.abspath(config.raw_chainspec),
+            "--port",
+            str(node["p2p-port"]),
+            "--rpc-port",
+            str(node["rpc-port"]),
+            "--validator",
+            "--name",
+            node["name"],
+            "--node-key-file",
+            node["node_key_path"],
+            "--rpc-cors",
+            "all",
+            "--prometheus-port",
+            str(node["prometheus-port"]),
+        ]
+
+        # The node writes to these fds directly, the parent's copies are closed after spawn
+        log_fd = _open_log(node["log_path"])
+        err_log_fd = _open_log(node["err_log_path"])
+        try:
+            # Without cwd and with close_fds=False, CPython launches the node with
+            # posix_spawn instead of fork + exec, so the parent's address space isn't
+            # duplicated. Our own fds are non-inheritable (PEP 446) so none leak
+            p = subprocess.Popen(cmd, stdout=err_log_fd, stderr=log_fd, close_fds=False)
+        finally:
+            os.close(log_fd)
+            os.close(err_log_fd)
+
+        return {"process": p, "name": node["name"]}
+
     def _start_network_bin(self, config: "CliConfig"):
         """Start network using local binary"""
         node_procs = []
-        start_messages = []
 
         with Progress() as progress:
             task = progress.add_task("[cyan]Starting nodes...", total=len(config.nodes))
 
-            for node in config.nodes:
-                # Ensure node directory exists
-                os.makedirs(f"{config.root_dir}/{node['name']}", exist_ok=True)
-
-                cmd = [
-                    self.source,
-                    "--base-path",
-                    node["name"],
-                    "--chain",
-                    config.raw_chainspec,
-                    "--port",
-                    str(node["p2p-port"]),
-                    "--rpc-port",
-                    str(node["rpc-port"]),
-                    "--validator",
-                    "--name",
-                    node["name"],
-                    "--node-key-file",
-                    f"{node['name']}/{node['name']}-node-private-key",
-                    "--rpc-cors",
-                    "all",
-                    "--prometheus-port",
-                    str(node["prometheus-port"]),
-                ]
-
-                log_file = open(
-                    f"{config.root_dir}/{node['name']}/{node['name']}.log", "w"
-                )
-                err_log_file = open(
-                    f"{config.root_dir}/{node['name']}/{node['name']}.error.log", "w"
-                )
-                self.open_files.extend([log_file, err_log_file])
-
-                p = subprocess.Popen(
-                    cmd, stdout=err_log_file, stderr=log_file, cwd=config.root_dir
-                )
+            # Spawn all nodes concurrently, startup takes as long as the slowest spawn
+            with ThreadPoolExecutor(max_workers=max(len(config.nodes), 1)) as executor:
+                futures = {
+                    executor.submit(self._spawn_node, config, node): node
+                    for node in config.nodes
+                }
+                errors = []
+                for future in as_completed(futures):
+                    node = futures[future]
+                    try:
+                        node_procs.append(future.result())
+                    except Exception as e:
+                        errors.append(f"{node['name']}: {e}")
+                        continue
+                    progress.update(
+                        task, advance=1, description=f"[cyan]Starting {node['name']}..."
+                    )
 
-                node_procs.append(
-                    {
-                        "process": p,
-                        "log_file": log_file,
-                        "err_log_file": err_log_file,
-                        "name": node["name"],
-                    }
-                )
+            # Keep nodes in config order for the status output and shutdown
+            order = {node["name"]: i for i, node in enumerate(config.nodes)}
+            node_procs.sort(key=lambda node_proc: order[node_proc["name"]])
+            self.running_nodes = node_procs
 
+            if not errors:
                 progress.update(
-                    task, advance=1, description=f"[cyan]Starting {node['name']}..."
-                )
-                start_messages.append(
-                    f"\t[dim]Started {node['name']} (PID: [yellow]{p.pid}[/yellow])[/dim]"
+                    task,
+                    description="[bold green]✓ All nodes started successfully[/bold green]",
                 )
 
-            progress.update(
-                task,
-                description="[bold green]✓ All nodes started successfully[/bold green]",
-            )
+        if errors:
+            # Don't leave the nodes that did start running
+            self._stop_network_bin()
+            raise RuntimeError("Failed to start nodes:\n" + "\n".join(errors))
 
-        for msg in start_messages:
-            console.print(msg, soft_wrap=True)
+        for node_proc in node_procs:
+            console.print(
+                f"\t[dim]Started {node_proc['name']} (PID: [yellow]{node_proc['process'].pid}[/yellow])[/dim]",
+                soft_wrap=True,
+            )
 
-        self.running_nodes = node_procs
         self._display_network_status(config)
 
     def _start_network_containers(self, config: "CliConfig"):
@@ -398,13 +554,9 @@ class Substrate:
 
             for node in config.nodes:
                 # Ensure node directory exists
-                os.makedirs(f"{config.root_dir}/{node['name']}", exist_ok=True)
-                log_file = os.path.abspath(
-                    f"{config.root_dir}/{node['name']}/{node['name']}.log"
-                )
-                err_log_file = os.path.abspath(
-                    f"{config.root_dir}/{node['name']}/{node['name']}.error.log"
-                )
+                os.makedirs(node["base_path"], exist_ok=True)
+                log_file = node["log_path"]
+                err_log_file = node["err_log_path"]
                 self.open_files.extend([log_file, err_log_file])
 
                 # Use default ports inside container (will be mapped to host ports)
@@ -425,7 +577,7 @@ class Substrate:
                         "--name",
                         node["name"],
                         "--node-key-file",
-                        f"/data/{node['name']}-node-private-key",
+                        f"/data/{os.path.basename(node['node_key_path'])}",
                         "--rpc-cors",
                         "all",
                         "--rpc-methods=unsafe",
@@ -441,7 +593,7 @@ class Substrate:
                         f"{PROM_DEFAULT}/tcp": str(node["prometheus-port"]),
                     },
                     volumes={
-                        os.path.join(config.root_dir, node["name"]): {
+                        node["base_path"]: {
                             "bind": "/data",
                             "mode": "rw",
                         },
@@ -457,9 +609,11 @@ class Substrate:
 
                 self.running_containers.append(container)
 
-                # Open log files for writing
-                log_file_handle = open(log_file, "w")
-                err_log_file_handle = open(err_log_file, "w")
+                # Open log files unbuffered so every log frame goes straight out
+                log_file_handle = os.fdopen(_open_log(log_file), "wb", buffering=0)
+                err_log_file_handle = os.fdopen(
+                    _open_log(err_log_file), "wb", buffering=0
+                )
                 self.open_files.extend([log_file_handle, err_log_file_handle])
 
                 # Start a background thread to stream logs
@@ -470,9 +624,9 @@ class Substrate:
                         stream=True, stdout=True, stderr=True, follow=True
                     ):
                         # Docker combines stdout and stderr unless you split them
-                        # Here, just write all logs to log_handle
-                        log_handle.write(line.decode())
-                        log_handle.flush()
+                        # Here, just write all logs to log_handle. The raw bytes go out in a
+                        # single unbuffered write per frame, so the log stays live for `tail -f`
+                        log_handle.write(line)
 
                 threading.Thread(
                     target=stream_container_logs,
@@ -528,15 +682,26 @@ class Substrate:
                 "[cyan]Stopping nodes...", total=len(self.running_containers)
             )
 
-            for container in self.running_containers:
-                try:
-                    container.stop()
-                    container.remove()
-                    progress.update(task, advance=1)
-                except Exception as e:
-                    console.print(
-                        f"[red]Error stopping container {container.name}: {e}[/red]"
-                    )
+            def stop_container(container):
+                container.stop()
+                container.remove()
+
+            # Stop all containers concurrently so the shutdown grace periods overlap
+            with ThreadPoolExecutor(
+                max_workers=max(len(self.running_containers), 1)
+            ) as executor:
+                futures = {
+                    executor.submit(stop_container, container): container
+                    for container in self.running_containers
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        progress.update(task, advance=1)
+                    except Exception as e:
+                        console.print(
+                            f"[red]Error stopping container {futures[future].name}: {e}[/red]"
+                        )
             # Close all open log file handles
             for file in self.open_files:
                 try:
@@ -564,23 +729,26 @@ class Substrate:
                 "[cyan]Stopping nodes...", total=len(self.running_nodes)
             )
 
+            # Signal every node first so they all shut down concurrently
+            for node_proc in self.running_nodes:
+                node_proc["process"].terminate()
+            # Then wait on them against one shared deadline
+            deadline = time.monotonic() + NODE_SHUTDOWN_TIMEOUT
             for node_proc in self.running_nodes:
-                self._cleanup_node(node_proc)
+                self._cleanup_node(node_proc, deadline)
                 progress.update(task, advance=1)
 
         console.print("[bold green]✓ All nodes stopped successfully[/bold green]")
         self.running_nodes = []
 
-    def _cleanup_node(self, node_proc: Dict[str, Any]):
-        """Cleanup node process and log files"""
-        node_proc["process"].terminate()
+    def _cleanup_node(self, node_proc: Dict[str, Any], deadline: float):
+        """Wait for an already terminated node process until `deadline`, kill it
+        past that"""
         try:
-            node_proc["process"].wait(timeout=2)
+            node_proc["process"].wait(timeout=max(deadline - time.monotonic(), 0))
         except subprocess.TimeoutExpired:
             node_proc["process"].kill()
             node_proc["process"].wait()
-        node_proc["log_file"].close()
-        node_proc["err_log_file"].close()
 
     def start_network(self, config: "CliConfig"):
         """Spawns a substrate node network"""
@@ -597,11 +765,49 @@ class Substrate:
             self._start_network_containers(config)
 
         try:
-            while True:
-                time.sleep(1.5)
+            self._wait_for_shutdown_signal()
         except KeyboardInterrupt:
             self.stop_network()
 
+    def _wait_for_shutdown_signal(self):
+        """
+        Blocks until Ctrl+C (SIGINT) or SIGTERM, both surfaced as KeyboardInterrupt.
+        Sleeps in `signal.pause()` so the interpreter isn't woken up until a signal arrives.
+        Local nodes that exit in the meantime are reported as soon as their SIGCHLD comes in.
+        """
+        if not hasattr(signal, "pause"):  # Windows
+            while True:
+                time.sleep(1.5)
+
+        def _interrupt(signum, frame):
+            raise KeyboardInterrupt
+
+        previous_handlers = {signal.SIGTERM: signal.signal(signal.SIGTERM, _interrupt)}
+        if self.is_bin:
+            # A Python level handler (even a no-op) is what makes pause() return on SIGCHLD
+            previous_handlers[signal.SIGCHLD] = signal.signal(
+                signal.SIGCHLD, lambda signum, frame: None
+            )
+        try:
+            while True:
+                signal.pause()
+                self._report_exited_nodes()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    def _report_exited_nodes(self):
+        """Print a warning for every local node process that exited since the last check"""
+        for node_proc in self.running_nodes:
+            if node_proc.get("exited"):
+                continue
+            returncode = node_proc["process"].poll()
+            if returncode is not None:
+                node_proc["exited"] = True
+                console.print(
+                    f"[bold red]✗ {node_proc['name']} exited unexpectedly with code {returncode}[/bold red]"
+                )
+
     def stop_network(self):
         """Stops the running network"""
         if self.exec_type == ExecType.BIN:
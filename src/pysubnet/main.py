@@ -1,8 +1,10 @@
 import os
-import json
 from pathlib import Path
+import secrets
 import sys
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rich.console import Console
 from rich.progress import Progress
@@ -10,13 +12,13 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.prompt import Confirm, Prompt
 
-from pysubnet.chainspec import Chainspec, ChainspecType
-from pysubnet.helpers.substrate import Substrate
-from pysubnet.chainspec_handlers import display_chain_customizations
+from pysubnet.chainspec import Chainspec, ChainspecType, release_cached_chainspecs
+from pysubnet.chainspec_handlers import display_chain_customizations, write_chainspec
 
 from .helpers import (
     l2_seg,
     parse_subkey_output,
+    serialization,
 )
 from .accounts import AccountKeyType
 from .cli import parse_args, CliConfig
@@ -26,6 +28,73 @@ console = Console()
 global INTERACTIVE, RUN_NETWORK, SUBSTRATE, ROOT_DIR, CHAINSPEC, NODES
 
 
+def _generate_node_keys(node: dict, account_key_type: AccountKeyType) -> dict:
+    """
+    Generates all keys for a single node. Safe to run concurrently for different nodes.
+    All substrate key commands for the node are batched into a single invocation.
+
+    Returns:
+        dict: Key fields to merge into `node`
+    """
+    # An ed25519 node key is just 32 random bytes, hex encoded as `generate-node-key` does.
+    # Writing it ourselves saves reading the generated file back
+    libp2p_private_key = secrets.token_hex(32)
+    with open(node["node_key_path"], "w") as key_file:
+        key_file.write(libp2p_private_key)
+
+    commands = [
+        # Peer ID of the node key
+        ["key", "inspect-node-key", "--file", os.path.basename(node["node_key_path"])],
+        # AURA keys (Sr25519)
+        ["key", "generate", "--scheme", "Sr25519"],
+        # BABE keys (Sr25519) - for BABE consensus
+        ["key", "generate", "--scheme", "Sr25519"],
+        # Grandpa keys (Ed25519)
+        ["key", "generate", "--scheme", "Ed25519"],
+    ]
+    if account_key_type == AccountKeyType.AccountId32:
+        # Validator account keys (Sr25519)
+        commands.append(["key", "generate", "--scheme", "Sr25519"])
+    peer_id, aura_out, babe_out, grandpa_out, *validator_out = (
+        SUBSTRATE.run_commands(commands, cwd=node["base_path"])
+    )
+
+    keys = {}
+    keys["libp2p-public-key"] = peer_id.strip()
+    keys["libp2p-private-key"] = libp2p_private_key
+
+    aura = parse_subkey_output(aura_out)
+    keys["aura-public-key"] = aura["public_key"]
+    keys["aura-private-key"] = aura["secret"]
+    keys["aura-secret-phrase"] = aura["secret_phrase"]
+    keys["aura-ss58"] = aura["ss58_address"]
+
+    babe = parse_subkey_output(babe_out)
+    keys["babe-public-key"] = babe["public_key"]
+    keys["babe-private-key"] = babe["secret"]
+    keys["babe-secret-phrase"] = babe["secret_phrase"]
+    keys["babe-ss58"] = babe["ss58_address"]
+
+    grandpa = parse_subkey_output(grandpa_out)
+    keys["grandpa-public-key"] = grandpa["public_key"]
+    keys["grandpa-private-key"] = grandpa["secret"]
+    keys["grandpa-secret-phrase"] = grandpa["secret_phrase"]
+    keys["grandpa-ss58"] = grandpa["ss58_address"]
+
+    # Generate account keys
+    if account_key_type == AccountKeyType.AccountId20:
+        validator = generate_ethereum_keypair()
+        keys["validator-accountid20-private-key"] = validator["private_key"]
+        keys["validator-accountid20-public-key"] = validator["ethereum_address"]
+    else:
+        validator = parse_subkey_output(validator_out[0])
+        keys["validator-accountid32-private-key"] = validator["secret"]
+        keys["validator-accountid32-public-key"] = validator["public_key"]
+        keys["validator-accountid32-ss58"] = validator["ss58_address"]
+
+    return keys
+
+
 def generate_keys(account_key_type: AccountKeyType):
     """
     Generates keys for the nodes:
@@ -35,225 +104,193 @@ def generate_keys(account_key_type: AccountKeyType):
     - Generates Grandpa ed25519 key
     - Generates validator account keys based on `account_key_type`
 
+    Nodes are independent of each other, so their keys are generated concurrently
+    (`subprocess` releases the GIL while waiting on substrate) and printed afterwards in order.
+
     Args:
         account_key_type (AccountKeyType): Type of account key to use for validator account id.
             Depends on the chain you're using
     """
     with console.status("[bold green]Generating keys for nodes...[/bold green]"):
-        # Define consistent field widths for alignment
-        key_type_width = 25
-        value_width = 60
-
-        for node in NODES:
-            console.print(
-                Panel.fit(
-                    f"[bold cyan]Setting up {node['name']}[/bold cyan]",
-                    subtitle=f"[dim]{l2_seg(node['base_path'])}[/dim]",
+        with ThreadPoolExecutor(max_workers=len(NODES)) as executor:
+            results = list(
+                executor.map(
+                    lambda node: _generate_node_keys(node, account_key_type), NODES
                 )
             )
-            # Generate node key and peer ID
-            SUBSTRATE.run_command(
-                [
-                    "key",
-                    "generate-node-key",
-                    "--file",
-                    f"{node['name']}-node-private-key",
-                ],
-                cwd=f"{node['base_path']}",
-            )
-            node["libp2p-public-key"] = SUBSTRATE.run_command(
-                [
-                    "key",
-                    "inspect-node-key",
-                    "--file",
-                    f"{node['name']}-node-private-key",
-                ],
-                cwd=f"{node['base_path']}",
-            )["stdout"].strip()
-            with open(
-                f"{ROOT_DIR}/{node['name']}/{node['name']}-node-private-key", "r"
-            ) as key_file:
-                node["libp2p-private-key"] = key_file.read().strip()
-
-            # Generate AURA keys (Sr25519)
-            aura_result = SUBSTRATE.run_command(
-                ["key", "generate", "--scheme", "Sr25519"],
-                cwd=f"{node['base_path']}",
-            )
-            aura = parse_subkey_output(aura_result["stdout"])
-            node["aura-public-key"] = aura["public_key"]
-            node["aura-private-key"] = aura["secret"]
-            node["aura-secret-phrase"] = aura["secret_phrase"]
-            node["aura-ss58"] = aura["ss58_address"]
-
-            # Generate BABE keys (Sr25519) - for BABE consensus
-            babe_result = SUBSTRATE.run_command(
-                ["key", "generate", "--scheme", "Sr25519"],
-                cwd=f"{node['base_path']}",
-            )
-            babe = parse_subkey_output(babe_result["stdout"])
-            node["babe-public-key"] = babe["public_key"]
-            node["babe-private-key"] = babe["secret"]
-            node["babe-secret-phrase"] = babe["secret_phrase"]
-            node["babe-ss58"] = babe["ss58_address"]
-
-            # Generate Grandpa keys (Ed25519)
-            grandpa_result = SUBSTRATE.run_command(
-                ["key", "generate", "--scheme", "Ed25519"],
-                cwd=f"{node['base_path']}",
-            )
-            grandpa = parse_subkey_output(grandpa_result["stdout"])
-            node["grandpa-public-key"] = grandpa["public_key"]
-            node["grandpa-private-key"] = grandpa["secret"]
-            node["grandpa-secret-phrase"] = grandpa["secret_phrase"]
-            node["grandpa-ss58"] = grandpa["ss58_address"]
-
-            # Generate account keys
-            if account_key_type == AccountKeyType.AccountId20:
-                validator = generate_ethereum_keypair()
-                node["validator-accountid20-private-key"] = validator["private_key"]
-                node["validator-accountid20-public-key"] = validator["ethereum_address"]
-            else:
-                validator_result = SUBSTRATE.run_command(
-                    ["key", "generate", "--scheme", "Sr25519"],
-                    cwd=f"{node['base_path']}",
-                )
-                validator = parse_subkey_output(validator_result["stdout"])
-                node["validator-accountid32-private-key"] = validator["secret"]
-                node["validator-accountid32-public-key"] = validator["public_key"]
-                node["validator-accountid32-ss58"] = validator["ss58_address"]
 
-            # Display all keys in aligned format
-            console.print(
-                f"\t[dim]{'Libp2p node key':<{key_type_width}}[/dim] [cyan]{node['libp2p-public-key']:<{value_width}}[/cyan]"
-            )
-            console.print(
-                f"\t[dim]{'Aura public key    (ss58)':<{key_type_width}}[/dim] [green]{node['aura-ss58']:<{value_width}}[/green]"
+    # Define consistent field widths for alignment
+    key_type_width = 25
+    value_width = 60
+
+    for node, keys in zip(NODES, results):
+        node.update(keys)
+        console.print(
+            Panel.fit(
+                f"[bold cyan]Setting up {node['name']}[/bold cyan]",
+                subtitle=f"[dim]{l2_seg(node['base_path'])}[/dim]",
             )
+        )
+
+        # Display all keys in aligned format
+        console.print(
+            f"\t[dim]{'Libp2p node key':<{key_type_width}}[/dim] [cyan]{node['libp2p-public-key']:<{value_width}}[/cyan]"
+        )
+        console.print(
+            f"\t[dim]{'Aura public key    (ss58)':<{key_type_width}}[/dim] [green]{node['aura-ss58']:<{value_width}}[/green]"
+        )
+        console.print(
+            f"\t[dim]{'Babe public key    (ss58)':<{key_type_width}}[/dim] [blue]{node['babe-ss58']:<{value_width}}[/blue]"
+        )
+        console.print(
+            f"\t[dim]{'Grandpa public key (ss58)':<{key_type_width}}[/dim] [yellow]{node['grandpa-ss58']:<{value_width}}[/yellow]"
+        )
+
+        if account_key_type == AccountKeyType.AccountId20:
             console.print(
-                f"\t[dim]{'Babe public key    (ss58)':<{key_type_width}}[/dim] [blue]{node['babe-ss58']:<{value_width}}[/blue]"
+                f"\t[dim]{'Validator AccountId20':<{key_type_width}}[/dim] [magenta]{node['validator-accountid20-public-key']:<{value_width}}[/magenta]"
             )
+        else:
             console.print(
-                f"\t[dim]{'Grandpa public key (ss58)':<{key_type_width}}[/dim] [yellow]{node['grandpa-ss58']:<{value_width}}[/yellow]"
+                f"\t[dim]{'Validator AccountId32':<{key_type_width}}[/dim] [blue]{node['validator-accountid32-ss58']:<{value_width}}[/blue]"
             )
 
-            if account_key_type == AccountKeyType.AccountId20:
-                console.print(
-                    f"\t[dim]{'Validator AccountId20':<{key_type_width}}[/dim] [magenta]{node['validator-accountid20-public-key']:<{value_width}}[/magenta]"
-                )
-            else:
-                console.print(
-                    f"\t[dim]{'Validator AccountId32':<{key_type_width}}[/dim] [blue]{node['validator-accountid32-ss58']:<{value_width}}[/blue]"
-                )
-
     # Write node configuration to a JSON file
-    with open(os.path.join(ROOT_DIR, "pysubnet.json"), "w") as f:
-        json.dump(NODES, f, indent=4)
+    serialization.dump_file(os.path.join(ROOT_DIR, "pysubnet.json"), NODES)
     console.print(
         f"\n[bold green]✓ Node configuration saved to [cyan]{ROOT_DIR}/pysubnet.json[/cyan][/bold green]"
     )
 
 
-def insert_keystore(chainspec: Chainspec, alternate=None, key_types=None):
+# key_type -> (scheme, keystore key type, node field holding the secret,
+#              node field holding the public key, display name)
+KEYSTORE_KEYS = {
+    "aura": ("Sr25519", "aura", "aura-private-key", "aura-public-key", "AURA"),
+    "babe": ("Sr25519", "babe", "babe-private-key", "babe-public-key", "BABE"),
+    "grandpa": (
+        "Ed25519",
+        "gran",
+        "grandpa-private-key",
+        "grandpa-public-key",
+        "Grandpa",
+    ),
+}
+
+
+def _write_keystore(node: dict, chain_id: str, key_types: list):
+    """
+    Write the session keys of `node` straight into its keystore, the way substrate's
+    LocalKeystore stores them: one file per key named `<hex key type><hex public key>`
+    holding the JSON encoded suri.
+    """
+    keystore = os.path.join(node["base_path"], "chains", chain_id, "keystore")
+    os.makedirs(keystore, exist_ok=True)
+    for key_type in key_types:
+        if key_type not in KEYSTORE_KEYS:
+            continue
+        _, keystore_key_type, secret_field, public_field, _ = KEYSTORE_KEYS[key_type]
+        file_name = keystore_key_type.encode().hex() + node[public_field].removeprefix(
+            "0x"
+        )
+        # Owner read/write only, same as substrate
+        fd = os.open(
+            os.path.join(keystore, file_name),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o600,
+        )
+        with open(fd, "wb") as f:
+            f.write(serialization.dumps(node[secret_field], pretty=False))
+
+
+def _insert_key(chainspec: Chainspec, node: dict, key_type: str):
+    """Insert a single session key of `key_type` into the keystore of `node`"""
+    scheme, keystore_key_type, secret_field, _, _ = KEYSTORE_KEYS[key_type]
+    chain = str(chainspec)
+    if SUBSTRATE.is_docker and isinstance(chainspec.value, Path):
+        # Use just the filename for Docker, since ROOT_DIR is mounted
+        chain = os.path.basename(chain)
+    SUBSTRATE.run_command(
+        [
+            "key",
+            "insert",
+            "--base-path",
+            node["name"],
+            "--chain",
+            chain,
+            "--scheme",
+            scheme,
+            "--key-type",
+            keystore_key_type,
+            "--suri",
+            node[secret_field],
+        ],
+        cwd=ROOT_DIR,
+        capture=False,
+    )
+
+
+def insert_keystore(
+    chainspec: Chainspec, alternate=None, key_types=None, strict=False
+):
     """Insert session keys into keystore for a particular Chainspec instance.
+    For local binaries the keystore files are written directly, without spawning substrate.
+    With `strict` (and always for docker) every (node, key type) goes through
+    `substrate key insert` instead. Those inserts are independent and run concurrently.
     Args:
         chainspec (Chainsepc): Instance of Chainspec to use
         alternate (str, optional): Move generated keys to alternate path, a different "chain_id" directory
         key_types (list, optional): List of key types to insert. Defaults to ['aura', 'grandpa']
+        strict (bool, optional): Always insert keys with `substrate key insert`
     """
     if key_types is None:
         key_types = ['aura', 'grandpa']
 
-    original_chainid = chainspec.get_chainid_with(SUBSTRATE)
+    # Files written on the host may not be readable by the user a container runs as,
+    # so docker keystores are always populated from inside the container
+    if not strict and SUBSTRATE.is_bin:
+        with console.status("[cyan]Writing keys into keystore...[/cyan]"):
+            if alternate is not None:
+                chain_id = alternate
+            elif isinstance(chainspec.value, Path):
+                chain_id = chainspec.get_chainid()
+            else:
+                chain_id = chainspec.get_chainid_with(SUBSTRATE, cwd=ROOT_DIR)
+            for node in NODES:
+                _write_keystore(node, chain_id, key_types)
+        console.print("[bold green]✓ All keys inserted successfully[/bold green]")
+        return
+
     with Progress() as progress:
         task = progress.add_task(
             "[cyan]Inserting keys into keystore...", total=len(NODES) * len(key_types)
         )
 
-        for node in NODES:
-            for key_type in key_types:
-                if key_type == 'aura':
-                    # Insert AURA keys
-                    SUBSTRATE.run_command(
-                        [
-                            "key",
-                            "insert",
-                            "--base-path",
-                            node["name"],
-                            "--chain",
-                            str(chainspec),
-                            "--scheme",
-                            "Sr25519",
-                            "--key-type",
-                            "aura",
-                            "--suri",
-                            node["aura-private-key"],
-                        ],
-                        cwd=ROOT_DIR,
-                    )
-                    progress.update(
-                        task,
-                        advance=1,
-                        description=f"[cyan]Inserting AURA keys for {node['name']}",
-                    )
-                elif key_type == 'babe':
-                    # Insert BABE keys
-                    SUBSTRATE.run_command(
-                        [
-                            "key",
-                            "insert",
-                            "--base-path",
-                            node["name"],
-                            "--chain",
-                            str(chainspec),
-                            "--scheme",
-                            "Sr25519",
-                            "--key-type",
-                            "babe",
-                            "--suri",
-                            node["babe-private-key"],
-                        ],
-                        cwd=ROOT_DIR,
-                    )
-                    progress.update(
-                        task,
-                        advance=1,
-                        description=f"[cyan]Inserting BABE keys for {node['name']}",
-                    )
-                elif key_type == 'grandpa':
-                    # Insert Grandpa Keys
-                    SUBSTRATE.run_command(
-                        [
-                            "key",
-                            "insert",
-                            "--base-path",
-                            node["name"],
-                            "--chain",
-                            str(chainspec),
-                            "--scheme",
-                            "Ed25519",
-                            "--key-type",
-                            "gran",
-                            "--suri",
-                            node["grandpa-private-key"],
-                        ],
-                        cwd=ROOT_DIR,
-                    )
-                    progress.update(
-                        task,
-                        advance=1,
-                        description=f"[cyan]Inserting Grandpa keys for {node['name']}",
-                    )
-    if alternate is not None:
-        for node in NODES:
-            orginal_keystore = Path(
-                os.path.join(
-                    ROOT_DIR, node["name"], "chains", original_chainid, "keystore"
+        with ThreadPoolExecutor(max_workers=len(NODES) * len(key_types)) as executor:
+            futures = {
+                executor.submit(_insert_key, chainspec, node, key_type): (node, key_type)
+                for node in NODES
+                for key_type in key_types
+                if key_type in KEYSTORE_KEYS
+            }
+            for future in as_completed(futures):
+                future.result()  # Re-raise a failed insert
+                node, key_type = futures[future]
+                progress.update(
+                    task,
+                    advance=1,
+                    description=f"[cyan]Inserting {KEYSTORE_KEYS[key_type][4]} keys for {node['name']}",
                 )
-            )
-            alternate_chain_dir = Path(
-                os.path.join(ROOT_DIR, node["name"], "chains", alternate)
-            )
+    # Keys were inserted under the chainspec's own chain id, only needed to relocate them
+    original_chainid = (
+        chainspec.get_chainid_with(SUBSTRATE, cwd=ROOT_DIR)
+        if alternate is not None
+        else None
+    )
+    if alternate is not None and alternate != original_chainid:
+        for node in NODES:
+            chains_dir = Path(node["base_path"], "chains")
+            orginal_keystore = chains_dir / original_chainid / "keystore"
+            alternate_chain_dir = chains_dir / alternate
 
             # Ensure the target directory exists
             alternate_chain_dir.mkdir(parents=True, exist_ok=True)
@@ -275,6 +312,34 @@ def insert_keystore(chainspec: Chainspec, alternate=None, key_types=None):
     console.print("[bold green]✓ All keys inserted successfully[/bold green]")
 
 
+def _clear_dir(path):
+    """
+    Replace `path` with an empty directory. The old tree is renamed out of the way, which is
+    instant, and deleted on a background thread so startup doesn't wait on it.
+    """
+    path = os.path.abspath(path)
+    old_path = f"{path}.old.{os.getpid()}"
+    try:
+        os.rename(path, old_path)
+    except OSError:
+        # E.g. no permission to write the parent directory, delete in place
+        shutil.rmtree(path)
+    else:
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(old_path,),
+            kwargs={"ignore_errors": True},
+            name="pysubnet-clear-dir",
+        ).start()
+    os.makedirs(path, exist_ok=True)
+
+
+def _is_nonempty_dir(path) -> bool:
+    """Returns True if `path` has at least one entry, without listing the whole directory"""
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
+
+
 def setup_dirs():
     """Create directories with rich output"""
     console.print(Panel.fit("[bold cyan]Setting up directory structure[/bold cyan]"))
@@ -286,15 +351,14 @@ def setup_dirs():
         ROOT_DIR,
     )
 
-    if len(os.listdir(ROOT_DIR)) > 0:  # ROOT_dir is not empty
+    if _is_nonempty_dir(ROOT_DIR):
         if INTERACTIVE:
             console.print(
                 f"[yellow]⚠ Warning:[/yellow] Root directory [cyan]{ROOT_DIR}[/cyan] is not empty."
             )
             if Confirm.ask("Clear it out?", default=True):
                 with console.status("[red]Cleaning directory...[/red]"):
-                    shutil.rmtree(ROOT_DIR)
-                    os.makedirs(ROOT_DIR, exist_ok=True)
+                    _clear_dir(ROOT_DIR)
                 console.print("[green]✓ Directory cleaned[/green]")
             else:
                 raise non_empty_exception
@@ -303,9 +367,18 @@ def setup_dirs():
 
     # Create directories
     with console.status("[cyan]Creating node directories...[/cyan]"):
+        root_dir = os.path.abspath(ROOT_DIR)
         for node in NODES:
-            os.makedirs(f"{ROOT_DIR}/{node['name']}", exist_ok=False)
-            node["base_path"] = f"{ROOT_DIR}/{node['name']}"
+            name = node["name"]
+            # Absolute, so the paths stay valid for processes started with a different cwd
+            # and can be used as docker volume sources as is
+            base_path = os.path.join(root_dir, name)
+            # ROOT_DIR exists and is empty at this point, a plain mkdir is enough
+            os.mkdir(base_path)
+            node["base_path"] = base_path
+            node["node_key_path"] = os.path.join(base_path, f"{name}-node-private-key")
+            node["log_path"] = os.path.join(base_path, f"{name}.log")
+            node["err_log_path"] = os.path.join(base_path, f"{name}.error.log")
             console.print(
                 f"\t[dim][green]✓[/green] Created directory for[/dim] [cyan]{node['name']}[/cyan]"
             )
@@ -325,16 +398,7 @@ def init_bootnodes_chainspec(chainspec: Chainspec, config: CliConfig) -> Chainsp
     c = chainspec.load_json()  # In-memory chainspec buffer
     if isinstance(chainspec.value, ChainspecType):
         console.print(f"[dim]Generating new [{chainspec}] chainspec...[/dim]")
-        c = SUBSTRATE.run_command(
-            [
-                "build-spec",
-                "--chain",
-                str(chainspec),
-                "--disable-default-bootnode",
-            ],
-            cwd=ROOT_DIR,
-            json=True,
-        )
+        c = chainspec.build_with(SUBSTRATE, cwd=ROOT_DIR)
 
     # Set bootnodes
     if config.substrate.is_bin:
@@ -359,8 +423,9 @@ def init_bootnodes_chainspec(chainspec: Chainspec, config: CliConfig) -> Chainsp
         if chainspec_config.chain_type:
             c["chainType"] = chainspec_config.chain_type
 
-    with open(chainspec_path, "w") as f:
-        json.dump(c, f, indent=2)
+    # Compact, chainspec.json is an intermediate read by the consensus handlers and substrate.
+    # Written through the handlers so the consensus handler reuses `c` instead of parsing it
+    write_chainspec(chainspec_path, c)
 
     console.print(
         Panel.fit(
@@ -380,33 +445,16 @@ def generate_raw_chainspec(chainspec_path: Path) -> Path:
 
     raw_chainspec_path = os.path.join(ROOT_DIR, "raw_chainspec.json")
     with console.status("[cyan]Building raw chainspec...[/cyan]"):
-        if SUBSTRATE.is_docker:
-            # Use just the filename for Docker, since ROOT_DIR is mounted
-            chainspec_filename = os.path.basename(chainspec_path)
-            result = SUBSTRATE.run_command(
-                [
-                    "build-spec",
-                    "--chain",
-                    chainspec_filename,
-                    "--raw",
-                ],
-                cwd=ROOT_DIR,
-                json=True,
-            )
-        else:
-            result = SUBSTRATE.run_command(
-                [
-                    "build-spec",
-                    "--chain",
-                    chainspec_path,
-                    "--raw",
-                ],
-                cwd=ROOT_DIR,
-                json=True,
-            )
-
-        with open(raw_chainspec_path, "w") as f:
-            f.write(json.dumps(result, indent=2))
+        # Use just the filename for Docker, since ROOT_DIR is mounted
+        chain = (
+            os.path.basename(chainspec_path) if SUBSTRATE.is_docker else chainspec_path
+        )
+        # Stream the (multi MB) raw chainspec straight to disk instead of through Python
+        SUBSTRATE.run_command_to_file(
+            ["build-spec", "--chain", chain, "--raw"],
+            raw_chainspec_path,
+            cwd=ROOT_DIR,
+        )
 
     console.print(
         Panel.fit(
@@ -513,6 +561,8 @@ def configure_network_consensus(chainspec: str, config: CliConfig):
 
 def main():
     config = parse_args()
+    from pysubnet.helpers.substrate import Substrate
+
     global INTERACTIVE, RUN_NETWORK, ROOT_DIR, SUBSTRATE, CHAINSPEC, NODES
     INTERACTIVE = config.interactive
     RUN_NETWORK = config.run_network
@@ -538,7 +588,7 @@ def main():
                 f"[dim]{config.root_dir}[/dim]",
             )
         )
-        shutil.rmtree(config.root_dir)
+        _clear_dir(config.root_dir)
 
     # Validate SUBSTRATE
     if config.substrate is None:
@@ -641,7 +691,14 @@ def main():
             console.print("[yellow]Aborting key insertion[/yellow]")
             return
     
-    insert_keystore(CHAINSPEC, alternate=customChainId, key_types=key_types)
+    # Insert against the edited chainspec, so keys land directly under its (possibly custom)
+    # chain id and no extra `build-spec` is needed to resolve and relocate them
+    insert_keystore(
+        Chainspec.from_path(chainspec), key_types=key_types, strict=config.strict
+    )
+    # Parsed chainspecs aren't needed past this point, don't hold on to them while the
+    # network runs
+    release_cached_chainspecs()
 
     # Generate raw chainspec
     config.raw_chainspec = generate_raw_chainspec(chainspec)
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("pydantic")
+
+from pysubnet import chainspec  # noqa: E402
+from pysubnet.chainspec import Chainspec, release_cached_chainspecs  # noqa: E402
+from pysubnet.helpers import serialization  # noqa: E402
+
+
+class FakeSubstrate:
+    """Stands in for `Substrate`, counts the `build-spec` runs"""
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.builds = 0
+
+    def run_command(self, args, cwd=None, json=False):
+        self.builds += 1
+        return {"id": "local_testnet", "built_by": self.fingerprint}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("PYSUBNET_NO_CACHE", raising=False)
+    release_cached_chainspecs()
+    yield tmp_path / "pysubnet"
+    release_cached_chainspecs()
+
+
+def test_cache_reused_for_same_build(cache_dir):
+    Chainspec.local().build_with(FakeSubstrate("bin:a"))
+    release_cached_chainspecs()
+
+    substrate = FakeSubstrate("bin:a")
+    assert Chainspec.local().build_with(substrate)["built_by"] == "bin:a"
+    assert substrate.builds == 0
+
+
+def test_fingerprint_change_replaces_entry(cache_dir):
+    Chainspec.local().build_with(FakeSubstrate("bin:old"))
+    release_cached_chainspecs()
+
+    substrate = FakeSubstrate("bin:new")
+    assert Chainspec.local().build_with(substrate)["built_by"] == "bin:new"
+    assert substrate.builds == 1
+
+    assert [p.name for p in cache_dir.iterdir()] == ["build-spec-local.json"]
+    entry = serialization.load_file(chainspec._spec_cache_path("local"))
+    assert entry["fingerprint"] == "bin:new"